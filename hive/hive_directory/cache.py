@@ -30,6 +30,9 @@ class CacheManager:
         self.shared_cache_dir = self.cache_dir / "shared"
         self.worker_cache_dir = self.cache_dir / "worker"
 
+        # 作成済みのワーカー専用ディレクトリ（毎回のmkdirを避ける）
+        self._known_worker_dirs: set[Path] = set()
+
         # キャッシュディレクトリを作成
         self.shared_cache_dir.mkdir(parents=True, exist_ok=True)
         self.worker_cache_dir.mkdir(parents=True, exist_ok=True)
@@ -145,7 +148,9 @@ class CacheManager:
         try:
             # ワーカー専用ディレクトリを作成
             worker_dir = self.worker_cache_dir / worker_id
-            worker_dir.mkdir(parents=True, exist_ok=True)
+            if worker_dir not in self._known_worker_dirs:
+                worker_dir.mkdir(parents=True, exist_ok=True)
+                self._known_worker_dirs.add(worker_dir)
 
             cache_data = {
                 "key": key,
@@ -162,9 +167,13 @@ class CacheManager:
 
             # ファイルに保存
             cache_file = worker_dir / f"{key}.json"
-            cache_file.write_text(
-                json.dumps(cache_data, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            content = json.dumps(cache_data, indent=2, ensure_ascii=False)
+            try:
+                cache_file.write_text(content, encoding="utf-8")
+            except FileNotFoundError:
+                # 外部でディレクトリが削除された場合は作り直して再試行
+                worker_dir.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(content, encoding="utf-8")
 
             logger.debug(f"Set worker cache: {worker_id}/{key}")
             return True
@@ -302,17 +311,17 @@ class CacheManager:
         try:
             # 共有キャッシュファイル
             if self.shared_cache_dir.exists():
-                for file_path in self.shared_cache_dir.glob("*.json"):
-                    cache_files["shared"].append(file_path.stem)
+                cache_files["shared"].extend(
+                    file_path.stem for file_path in self.shared_cache_dir.glob("*.json")
+                )
 
             # ワーカー専用キャッシュファイル
             if self.worker_cache_dir.exists():
                 for worker_dir in self.worker_cache_dir.iterdir():
                     if worker_dir.is_dir():
-                        worker_files = []
-                        for file_path in worker_dir.glob("*.json"):
-                            worker_files.append(file_path.stem)
-                        cache_files["worker"][worker_dir.name] = worker_files
+                        cache_files["worker"][worker_dir.name] = [
+                            file_path.stem for file_path in worker_dir.glob("*.json")
+                        ]
 
         except Exception as e:
             logger.error(f"Failed to list cache files: {e}")
@@ -405,6 +414,7 @@ class CacheManager:
                         try:
                             if not any(worker_dir.iterdir()):
                                 worker_dir.rmdir()
+                                self._known_worker_dirs.discard(worker_dir)
                                 logger.debug(
                                     f"Deleted empty worker cache directory: {worker_dir.name}"
                                 )
@@ -433,6 +443,7 @@ class CacheManager:
             if self.worker_cache_dir.exists():
                 shutil.rmtree(self.worker_cache_dir)
                 self.worker_cache_dir.mkdir(parents=True, exist_ok=True)
+                self._known_worker_dirs.clear()
 
             logger.info("Cleared all cache files")
             return True
@@ -143,14 +143,20 @@ class ConfigManager:
             config: 設定データ
         """
         if file_path.suffix.lower() in [".yaml", ".yml"]:
-            file_path.write_text(
-                yaml.dump(config, default_flow_style=False, allow_unicode=True),
-                encoding="utf-8",
-            )
+            content = yaml.dump(config, default_flow_style=False, allow_unicode=True)
         else:
-            file_path.write_text(
-                json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
+            content = json.dumps(config, indent=2, ensure_ascii=False)
+
+        # 内容が変わらない場合は書き込みを省略（mtimeも維持される）
+        # 読めない・壊れたファイルは比較せずに上書きして修復する
+        try:
+            if file_path.read_text(encoding="utf-8") == content:
+                logger.debug(f"Config unchanged, skipped writing: {file_path}")
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        file_path.write_text(content, encoding="utf-8")
 
     def _load_config(self, file_path: Path) -> dict[str, Any] | None:
         """
@@ -85,7 +85,7 @@ class DocumentManager:
                 content, report_name, report_type, session_id
             )
 
-            file_path.write_text(full_content, encoding="utf-8")
+            file_path = self._write_new_file(file_path, full_content)
 
             logger.info(f"Created report: {file_path}")
             return file_path
@@ -120,7 +120,7 @@ class DocumentManager:
                 content, analysis_name, "analysis", session_id
             )
 
-            file_path.write_text(full_content, encoding="utf-8")
+            file_path = self._write_new_file(file_path, full_content)
 
             logger.info(f"Created analysis document: {file_path}")
             return file_path
@@ -155,7 +155,7 @@ class DocumentManager:
                 content, design_name, "design", session_id
             )
 
-            file_path.write_text(full_content, encoding="utf-8")
+            file_path = self._write_new_file(file_path, full_content)
 
             logger.info(f"Created design document: {file_path}")
             return file_path
@@ -190,7 +190,7 @@ class DocumentManager:
                 content, meeting_name, "meeting", session_id
             )
 
-            file_path.write_text(full_content, encoding="utf-8")
+            file_path = self._write_new_file(file_path, full_content)
 
             logger.info(f"Created meeting notes: {file_path}")
             return file_path
@@ -199,6 +199,34 @@ class DocumentManager:
             logger.error(f"Failed to create meeting notes {meeting_name}: {e}")
             raise
 
+    def _write_new_file(self, file_path: Path, content: str) -> Path:
+        """
+        既存ファイルを上書きせずに新規ファイルとして書き込み
+
+        ファイル名は秒単位のタイムスタンプを含むため、同一秒内に同名の
+        ドキュメントが作成された場合は連番を付与して別ファイルにする
+
+        Args:
+            file_path: 書き込み先のファイルパス
+            content: 書き込む内容
+
+        Returns:
+            Path: 実際に書き込んだファイルのパス
+        """
+        candidate = file_path
+        counter = 1
+        while True:
+            try:
+                # "x"モード（O_CREAT | O_EXCL）で作成し、既存ファイルの上書きを防ぐ
+                with open(candidate, "x", encoding="utf-8") as f:
+                    f.write(content)
+                return candidate
+            except FileExistsError:
+                candidate = file_path.with_name(
+                    f"{file_path.stem}_{counter}{file_path.suffix}"
+                )
+                counter += 1
+
     def _add_metadata(
         self, content: str, title: str, doc_type: str, session_id: str | None
     ) -> str:
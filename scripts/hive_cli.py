@@ -13,6 +13,7 @@ import subprocess
 import sys
 import time
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -25,11 +26,15 @@ import importlib.util
 import sys
 from pathlib import Path
 
-from scripts.worker_communication import WorkerCommunicationError
+from scripts.worker_communication import (
+    TMUX_COMMAND_TIMEOUT,
+    WorkerCommunicationError,
+)
 
 
+@cache
 def _get_hive_watch_communicator() -> Any:
-    """HiveWatchCommunicatorを動的にimportして取得"""
+    """HiveWatchCommunicatorを動的にimportして取得（モジュール読み込みは初回のみ）"""
     spec = importlib.util.spec_from_file_location(
         "hive_watch_module", Path(__file__).parent / "hive_watch.py"
     )
@@ -199,13 +204,14 @@ class HiveCLI:
         - echo: echo方式（コンソール表示）
         - claude_interactive: Claude Code方式（対話型）
         """
-        if not self.communicator.check_worker_pane(worker):
+        # tmuxへの確認はブロッキングのためスレッドで実行
+        if not await asyncio.to_thread(self.communicator.check_worker_pane, worker):
             raise WorkerCommunicationError(f"Worker pane '{worker}' not found")
 
         worker_config = self.communicator.config["workers"][worker]
         pane_name = worker_config["tmux_pane"]
         delivery_method = worker_config.get("delivery_method", "claude_interactive")
-        start_time = time.time()
+        start_time = time.monotonic()
 
         if delivery_method == "echo":
             # echo方式（コンソール表示）
@@ -228,7 +234,8 @@ class HiveCLI:
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] 📨 {message}"
 
-        subprocess.run(
+        await asyncio.to_thread(
+            subprocess.run,
             [
                 "tmux",
                 "send-keys",
@@ -238,9 +245,10 @@ class HiveCLI:
                 "Enter",
             ],
             check=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
         )
 
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         return {
             "task_id": task_id,
@@ -261,15 +269,23 @@ class HiveCLI:
         """Claude Codeワーカーへの対話型送信"""
         # Step 1: メッセージ送信 + Enter
         print(f"📤 Sending to {worker}: {message[:50]}...")
-        subprocess.run(
-            ["tmux", "send-keys", "-t", pane_name, message, "Enter"], check=True
+        await asyncio.to_thread(
+            subprocess.run,
+            ["tmux", "send-keys", "-t", pane_name, message, "Enter"],
+            check=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
         )
 
         # Step 2: 処理時間確保（1秒待機）
         await asyncio.sleep(1)
 
         # Step 3: 確認用Enter送信
-        subprocess.run(["tmux", "send-keys", "-t", pane_name, "Enter"], check=True)
+        await asyncio.to_thread(
+            subprocess.run,
+            ["tmux", "send-keys", "-t", pane_name, "Enter"],
+            check=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
+        )
 
         # Step 4: レスポンス待機（オプション）
         response_content = ""
@@ -277,7 +293,7 @@ class HiveCLI:
             timeout = 30  # 簡単なメッセージなので短いタイムアウト
             response_content = await self._wait_for_simple_response(pane_name, timeout)
 
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         return {
             "task_id": task_id,
@@ -294,31 +310,19 @@ class HiveCLI:
 
     async def _wait_for_simple_response(self, pane_name: str, timeout: int) -> str:
         """シンプルなレスポンス待機（[TASK_COMPLETED]は期待しない）"""
-        start_time = time.time()
+        start_time = time.monotonic()
         initial_content = ""
 
         # 初期コンテンツを取得
         try:
-            result = subprocess.run(
-                ["tmux", "capture-pane", "-t", pane_name, "-p"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            initial_content = result.stdout
+            initial_content = await self.communicator.capture_pane(pane_name)
         except subprocess.SubprocessError:
             pass
 
         # 変化を待機
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             try:
-                result = subprocess.run(
-                    ["tmux", "capture-pane", "-t", pane_name, "-p"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                current_content = result.stdout
+                current_content = await self.communicator.capture_pane(pane_name)
 
                 # コンテンツが変化したら応答とみなす
                 if current_content != initial_content:
@@ -342,25 +346,20 @@ class HiveCLI:
 
     async def list_workers(self) -> dict[str, Any]:
         """Worker一覧と状態を取得"""
-        status: dict[str, Any] = self.communicator.monitor_worker_status()
+        status: dict[str, Any] = await asyncio.to_thread(
+            self.communicator.monitor_worker_status
+        )
         return status
 
     async def get_worker_history(self, worker: str, lines: int = 20) -> str:
         """Worker履歴を取得"""
-        if not self.communicator.check_worker_pane(worker):
+        if not await asyncio.to_thread(self.communicator.check_worker_pane, worker):
             return f"Worker '{worker}' not found"
 
         pane_name = self.communicator.config["workers"][worker]["tmux_pane"]
 
         try:
-            result = subprocess.run(
-                ["tmux", "capture-pane", "-t", pane_name, "-p", "-S", f"-{lines}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            return result.stdout
+            return await self.communicator.capture_pane(pane_name, start_line=-lines)
         except subprocess.SubprocessError as e:
             return f"Error capturing history: {e}"
 
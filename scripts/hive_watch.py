@@ -9,8 +9,10 @@ Issue #125 - Phase 1: 基本監視機能実装
 import argparse
 import asyncio
 import json
+import re
 import sys
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -20,6 +22,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scripts.worker_communication import WorkerCommunicator
 
+# ログ表示用: メッセージタイプ → 矢印
+MESSAGE_TYPE_ARROWS = {
+    "task": "→",
+    "direct": "→",
+    "task_start": "→",
+    "result": "←",
+    "response": "←",
+    "task_complete": "←",
+    "parallel_start": "⚡",
+    "parallel_complete": "⚡",
+}
+
 
 class CommunicationLogger:
     """通信メッセージのログ記録"""
@@ -38,9 +52,10 @@ class CommunicationLogger:
         additional_info: dict[str, Any] | None = None,
     ) -> None:
         """通信メッセージをログに記録"""
-        timestamp = datetime.now().isoformat()
+        # 時刻取得はメッセージ毎に1回のみ（ログとコンソール表示で共有）
+        now = datetime.now()
         log_entry = {
-            "timestamp": timestamp,
+            "timestamp": now.isoformat(),
             "session_id": self.session_id,
             "source": source,
             "target": target,
@@ -54,7 +69,7 @@ class CommunicationLogger:
             f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
 
         # コンソールにも出力
-        time_str = datetime.now().strftime("%H:%M:%S")
+        time_str = now.strftime("%H:%M:%S")
         arrow = "→" if message_type == "task" else "←"
         print(f"{time_str} | {source} {arrow} {target} | {message[:100]}...")
 
@@ -87,12 +102,16 @@ class MessageParser:
             "status_update": r"STATUS_UPDATE:(\w+):(\w+)",
         }
 
+        # パターンを事前コンパイル（メッセージ毎の再解析を避ける）
+        self.compiled_patterns: dict[str, re.Pattern[str]] = {
+            pattern_name: re.compile(pattern)
+            for pattern_name, pattern in self.patterns.items()
+        }
+
     def parse_message(self, content: str) -> dict[str, Any]:
         """メッセージを解析してタイプと内容を特定"""
-        import re
-
-        for pattern_name, pattern in self.patterns.items():
-            match = re.search(pattern, content)
+        for pattern_name, compiled_pattern in self.compiled_patterns.items():
+            match = compiled_pattern.search(content)
             if match:
                 return {
                     "type": pattern_name,
@@ -132,7 +151,7 @@ class HiveWatchCommunicator(WorkerCommunicator):
         # アクティブタスクに追加
         self.active_tasks[task_id] = {
             "worker_name": worker_name,
-            "start_time": time.time(),
+            "start_time": time.monotonic(),
             "task": task,
         }
 
@@ -203,7 +222,7 @@ class HiveWatchCommunicator(WorkerCommunicator):
 
     def get_active_tasks_status(self) -> dict[str, Any]:
         """アクティブタスクの状態を取得"""
-        current_time = time.time()
+        current_time = time.monotonic()
         status = {}
 
         for task_id, task_info in self.active_tasks.items():
@@ -237,8 +256,10 @@ class HiveWatch:
 
         while self.monitoring:
             try:
-                # Worker状態確認
-                worker_status = self.communicator.monitor_worker_status()
+                # Worker状態確認（tmuxへの問い合わせはブロッキングのためスレッドで実行）
+                worker_status = await asyncio.to_thread(
+                    self.communicator.monitor_worker_status
+                )
 
                 # アクティブタスク状態確認
                 active_tasks = self.communicator.get_active_tasks_status()
@@ -303,8 +324,9 @@ class HiveWatch:
         print("=" * 50)
 
         with open(log_file, encoding="utf-8") as f:
-            lines = f.readlines()
-            recent_lines = lines[-tail_lines:] if len(lines) > tail_lines else lines
+            # 全行をリスト化せず、末尾tail_lines行だけを保持しながら読み進める
+            # （負の値はdequeが受け付けないため0に丸める）
+            recent_lines = deque(f, maxlen=max(tail_lines, 0))
 
             for line in recent_lines:
                 try:
@@ -321,15 +343,7 @@ class HiveWatch:
                         "event_type", "unknown"
                     )
 
-                    arrow = (
-                        "→"
-                        if msg_type in ["task", "direct", "task_start"]
-                        else "←"
-                        if msg_type in ["result", "response", "task_complete"]
-                        else "⚡"
-                        if msg_type in ["parallel_start", "parallel_complete"]
-                        else "•"
-                    )
+                    arrow = MESSAGE_TYPE_ARROWS.get(msg_type, "•")
                     print(
                         f"{timestamp} | {source} {arrow} {target} | {message[:80]}..."
                     )
@@ -6,8 +6,10 @@ TASK:TEMPLATE_004 UI表示機能実装
 テンプレート検知結果を視覚的に表示するUI機能を提供
 """
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -23,6 +25,9 @@ else:
         TemplateMatch = Any
         TemplateType = Any
 
+# 検知履歴の保持上限（長時間稼働時のメモリ増加を防ぐ）
+HISTORY_MAX_ENTRIES = 1000
+
 
 @dataclass
 class UIDisplayConfig:
@@ -236,7 +241,7 @@ class TemplateUIManager:
 
     def __init__(self, templates_dir: str = "templates/communication"):
         self.formatter = TemplateUIFormatter(templates_dir)
-        self.history: list[dict[str, Any]] = []
+        self.history: deque[dict[str, Any]] = deque(maxlen=HISTORY_MAX_ENTRIES)
 
     def display_template_result(
         self, message: str, matches: list[TemplateMatch]
@@ -268,7 +273,10 @@ class TemplateUIManager:
         if not self.history:
             return "📜 No template detection history"
 
-        recent_history = self.history[-last_n:]
+        # dequeは全体をコピーせず、末尾last_n件だけを取り出す
+        recent_history = list(
+            islice(self.history, max(len(self.history) - last_n, 0), None)
+        )
 
         result = f"📜 TEMPLATE DETECTION HISTORY (last {len(recent_history)} items)\n"
         result += "=" * 50 + "\n"
@@ -640,37 +640,40 @@ class TemplateValidator:
         """バリデーションレポートを生成"""
         results = self.validate_all_configs(config_dir)
 
-        report = "# 🔍 Template Configuration Validation Report\n\n"
-
         total_files = len(results)
         valid_files = sum(1 for result in results.values() if result.is_valid)
+        level_icons = {"error": "🔴", "warning": "🟡", "info": "ℹ️"}
 
-        report += "## 📊 Summary\n"
-        report += f"- **Total Files**: {total_files}\n"
-        report += f"- **Valid Files**: {valid_files}\n"
-        report += f"- **Invalid Files**: {total_files - valid_files}\n\n"
+        # 文字列の逐次連結を避け、パーツを集めて最後に一度だけ結合する
+        parts = [
+            "# 🔍 Template Configuration Validation Report\n\n",
+            "## 📊 Summary\n",
+            f"- **Total Files**: {total_files}\n",
+            f"- **Valid Files**: {valid_files}\n",
+            f"- **Invalid Files**: {total_files - valid_files}\n\n",
+        ]
 
         for filename, result in results.items():
             status = "✅" if result.is_valid else "❌"
             score = f"{result.score:.1%}"
 
-            report += f"## {status} {filename} (Score: {score})\n\n"
+            parts.append(f"## {status} {filename} (Score: {score})\n\n")
 
             if result.issues:
                 for issue in result.issues:
-                    level_icon = {"error": "🔴", "warning": "🟡", "info": "ℹ️"}[
-                        issue.level.value
-                    ]
-                    report += f"- {level_icon} **{issue.level.value.upper()}**: {issue.message}\n"
+                    level_icon = level_icons[issue.level.value]
+                    parts.append(
+                        f"- {level_icon} **{issue.level.value.upper()}**: {issue.message}\n"
+                    )
                     if issue.suggestion:
-                        report += f"  - 💡 **Suggestion**: {issue.suggestion}\n"
+                        parts.append(f"  - 💡 **Suggestion**: {issue.suggestion}\n")
                     if issue.location:
-                        report += f"  - 📍 **Location**: `{issue.location}`\n"
-                    report += "\n"
+                        parts.append(f"  - 📍 **Location**: `{issue.location}`\n")
+                    parts.append("\n")
             else:
-                report += "No issues found.\n\n"
+                parts.append("No issues found.\n\n")
 
-        return report
+        return "".join(parts)
 
 
 # CLI統合とテスト実行
@@ -16,6 +16,8 @@ from typing import Any
 # プロジェクトルートをPythonパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scripts.worker_communication import TMUX_COMMAND_TIMEOUT
+
 
 class TMuxMonitor:
     """tmux セッションの監視とpaneコンテンツ取得"""
@@ -40,6 +42,7 @@ class TMuxMonitor:
                 ["tmux", "has-session", "-t", self.session_name],
                 capture_output=True,
                 text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
             return result.returncode == 0
         except subprocess.SubprocessError:
@@ -55,6 +58,7 @@ class TMuxMonitor:
                 ["tmux", "list-panes", "-t", self.session_name, "-F", "#{pane_title}"],
                 capture_output=True,
                 text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
 
             if result.returncode == 0:
@@ -83,6 +87,7 @@ class TMuxMonitor:
                 ],
                 capture_output=True,
                 text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
 
             if result.returncode == 0:
@@ -165,6 +170,7 @@ class TMuxSessionInfo:
                 subprocess.run(
                     ["tmux", "has-session", "-t", self.session_name],
                     capture_output=True,
+                    timeout=TMUX_COMMAND_TIMEOUT,
                 ).returncode
                 == 0
             )
@@ -189,6 +195,7 @@ class TMuxSessionInfo:
                 ],
                 capture_output=True,
                 text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
 
             panes = {}
@@ -47,10 +47,15 @@ def check_hive_system() -> bool:
     """Hiveシステムの状態を確認"""
     print("🐝 Checking Hive system status...")
 
+    from scripts.worker_communication import TMUX_COMMAND_TIMEOUT
+
     # tmuxセッション確認
     try:
         result = subprocess.run(
-            ["tmux", "has-session", "-t", "cozy-hive"], capture_output=True, text=True
+            ["tmux", "has-session", "-t", "cozy-hive"],
+            capture_output=True,
+            text=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
         )
 
         if result.returncode == 0:
@@ -26,11 +26,13 @@ Both systems share the same tmux infrastructure and Hive Watch monitoring.
 """
 
 import asyncio
+import contextlib
 import json
 import os
 import subprocess
 import tempfile
 import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -42,6 +44,10 @@ except ImportError:
     yaml = None  # type: ignore
 
 
+# Upper bound for a single tmux command; a wedged tmux server must not hang callers
+TMUX_COMMAND_TIMEOUT = 10
+
+
 class WorkerCommunicationError(Exception):
     """Worker communication related errors"""
 
@@ -218,6 +224,7 @@ class WorkerCommunicator:
                 ["tmux", "has-session", "-t", self.session_name],
                 capture_output=True,
                 text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
             return result.returncode == 0
         except subprocess.SubprocessError:
@@ -231,7 +238,10 @@ class WorkerCommunicator:
         pane_name = self.config["workers"][worker_name]["tmux_pane"]
         try:
             result = subprocess.run(
-                ["tmux", "list-panes", "-t", pane_name], capture_output=True, text=True
+                ["tmux", "list-panes", "-t", pane_name],
+                capture_output=True,
+                text=True,
+                timeout=TMUX_COMMAND_TIMEOUT,
             )
             return result.returncode == 0
         except subprocess.SubprocessError:
@@ -241,12 +251,13 @@ class WorkerCommunicator:
         self, worker_name: str, task: dict[str, Any]
     ) -> dict[str, Any]:
         """Send task to specific worker via tmux direct communication"""
-        if not self.check_tmux_session():
+        # tmux checks block; run them in a worker thread
+        if not await asyncio.to_thread(self.check_tmux_session):
             raise WorkerCommunicationError(
                 f"Tmux session '{self.session_name}' not found"
             )
 
-        if not self.check_worker_pane(worker_name):
+        if not await asyncio.to_thread(self.check_worker_pane, worker_name):
             raise WorkerCommunicationError(f"Worker pane '{worker_name}' not found")
 
         # Generate task ID
@@ -306,15 +317,53 @@ class WorkerCommunicator:
         This ensures Claude Code properly processes and confirms the input.
         """
         # Step 1: Send the message with Enter
-        subprocess.run(
-            ["tmux", "send-keys", "-t", pane_name, message, "Enter"], check=True
+        await asyncio.to_thread(
+            subprocess.run,
+            ["tmux", "send-keys", "-t", pane_name, message, "Enter"],
+            check=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
         )
 
         # Step 2: Wait 1 second for message processing
         await asyncio.sleep(1)
 
         # Step 3: Send additional Enter for confirmation
-        subprocess.run(["tmux", "send-keys", "-t", pane_name, "Enter"], check=True)
+        await asyncio.to_thread(
+            subprocess.run,
+            ["tmux", "send-keys", "-t", pane_name, "Enter"],
+            check=True,
+            timeout=TMUX_COMMAND_TIMEOUT,
+        )
+
+    async def capture_pane(self, pane_name: str, start_line: int | None = None) -> str:
+        """Capture tmux pane content without blocking the event loop
+
+        start_line is passed to capture-pane -S; negative values reach into
+        the pane's scrollback history.
+        """
+        cmd = ["tmux", "capture-pane", "-t", pane_name, "-p"]
+        if start_line is not None:
+            cmd.extend(["-S", str(start_line)])
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=TMUX_COMMAND_TIMEOUT
+            )
+        except TimeoutError as e:
+            # The child may exit between the timeout firing and the kill
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, TMUX_COMMAND_TIMEOUT) from e
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode or 1, cmd, stdout, stderr
+            )
+        return stdout.decode("utf-8", errors="replace")
 
     def _create_worker_message(self, worker_name: str, task: dict[str, Any]) -> str:
         """Create message to send to Claude worker"""
@@ -353,20 +402,13 @@ python3 scripts/hive_cli.py send queen 'WORKER_RESULT:{worker_name}:{task_id}:[
         self, pane_name: str, timeout: int
     ) -> dict[str, Any]:
         """Wait for Claude response via tmux capture-pane"""
-        start_time = time.time()
+        start_time = time.monotonic()
         last_content = ""
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             try:
                 # Capture pane content
-                result = subprocess.run(
-                    ["tmux", "capture-pane", "-t", pane_name, "-p"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-
-                current_content = result.stdout
+                current_content = await self.capture_pane(pane_name)
 
                 # Check if Claude has completed the task
                 if "[TASK_COMPLETED]" in current_content:
@@ -377,7 +419,7 @@ python3 scripts/hive_cli.py send queen 'WORKER_RESULT:{worker_name}:{task_id}:[
                         "output": response_text,
                         "status": "completed",
                         "content": response_text,
-                        "processing_time": time.time() - start_time,
+                        "processing_time": time.monotonic() - start_time,
                         "timestamp": datetime.now().isoformat(),
                     }
 
@@ -385,7 +427,7 @@ python3 scripts/hive_cli.py send queen 'WORKER_RESULT:{worker_name}:{task_id}:[
                 if current_content != last_content:
                     last_content = current_content
                     # Reset timeout if Claude is actively responding
-                    start_time = time.time()
+                    start_time = time.monotonic()
 
                 await asyncio.sleep(2)  # Check every 2 seconds
 
@@ -449,20 +491,18 @@ python3 scripts/hive_cli.py send queen 'WORKER_RESULT:{worker_name}:{task_id}:[
         )
 
         # Group tasks by worker
-        worker_tasks: dict[str, list[dict[str, Any]]] = {}
+        worker_tasks: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
         for task in tasks:
             worker_name = task.get("worker_name")
-            if not worker_name:
-                continue
-            if worker_name not in worker_tasks:
-                worker_tasks[worker_name] = []
-            worker_tasks[worker_name].append(task)
+            if worker_name:
+                worker_tasks[worker_name].append(task)
 
         # Send tasks in parallel
-        async_tasks = []
-        for worker_name, worker_task_list in worker_tasks.items():
-            for task in worker_task_list:
-                async_tasks.append(self.send_task_to_worker(worker_name, task))
+        async_tasks = [
+            self.send_task_to_worker(worker_name, task)
+            for worker_name, worker_task_list in worker_tasks.items()
+            for task in worker_task_list
+        ]
 
         # Wait for all results
         results = await asyncio.gather(*async_tasks, return_exceptions=True)
@@ -0,0 +1,5 @@
+"""
+Hive Module Tests
+
+Hive関連のテストモジュール
+"""
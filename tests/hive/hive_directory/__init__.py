@@ -0,0 +1,5 @@
+"""
+Hive Directory Tests
+
+.hive/ディレクトリ管理のテストモジュール
+"""
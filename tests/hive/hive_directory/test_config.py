@@ -0,0 +1,44 @@
+"""
+Test ConfigManager
+
+設定ファイル保存処理のテスト
+"""
+
+import os
+
+import pytest
+
+from hive.hive_directory.config import ConfigManager
+
+
+class TestConfigManagerSave:
+    """ConfigManager._save_configのテストクラス"""
+
+    def test_save_config_skips_unchanged_content(self, tmp_path):
+        """内容が変わらない場合は書き込まずmtimeを維持するテスト"""
+        manager = ConfigManager(tmp_path / ".hive")
+        config_path = manager.config_dir / "test_config.yaml"
+        config = {"name": "hive", "workers": ["queen", "developer"]}
+
+        manager._save_config(config_path, config)
+
+        # 比較しやすいよう過去のmtimeを設定
+        os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+
+        manager._save_config(config_path, config)
+
+        assert config_path.stat().st_mtime_ns == 1_000_000_000
+
+    def test_save_config_overwrites_undecodable_file(self, tmp_path):
+        """UTF-8として読めない設定ファイルを上書きして修復するテスト"""
+        manager = ConfigManager(tmp_path / ".hive")
+        config_path = manager.config_dir / "test_config.json"
+        config_path.write_bytes(b"\xff\xfe garbage")
+
+        manager._save_config(config_path, {"name": "hive"})
+
+        assert manager._load_config(config_path) == {"name": "hive"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
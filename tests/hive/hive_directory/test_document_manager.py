@@ -0,0 +1,39 @@
+"""
+Test DocumentManager
+
+ドキュメント作成処理のテスト
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from hive.hive_directory.document_manager import DocumentManager
+
+
+class TestDocumentManagerCreate:
+    """DocumentManagerのドキュメント作成テストクラス"""
+
+    def test_create_report_does_not_overwrite_same_second(self, tmp_path):
+        """同一秒内に同名レポートを作成しても上書きしないテスト"""
+        manager = DocumentManager(tmp_path / ".hive")
+
+        # タイムスタンプを固定して同一秒内の作成を再現
+        with patch("hive.hive_directory.document_manager.datetime") as mock_datetime:
+            mock_datetime.now.return_value.strftime.return_value = "20240101_120000"
+            mock_datetime.now.return_value.isoformat.return_value = (
+                "2024-01-01T12:00:00"
+            )
+
+            first = manager.create_report("Daily Report", "first content")
+            second = manager.create_report("Daily Report", "second content")
+
+        assert first != second
+        assert first.name == "20240101_120000_general_Daily_Report.md"
+        assert second.name == "20240101_120000_general_Daily_Report_1.md"
+        assert "first content" in first.read_text(encoding="utf-8")
+        assert "second content" in second.read_text(encoding="utf-8")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
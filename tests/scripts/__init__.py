@@ -0,0 +1,5 @@
+"""
+Scripts Tests
+
+scripts/配下モジュールのテスト
+"""
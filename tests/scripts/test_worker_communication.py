@@ -0,0 +1,110 @@
+"""
+WorkerCommunicator Tests
+
+tmuxペインキャプチャ処理のテスト
+"""
+
+import asyncio
+import subprocess
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from scripts.worker_communication import WorkerCommunicator
+
+
+def _mock_process(returncode=0, stdout=b"", stderr=b""):
+    """create_subprocess_execが返すプロセスのモックを作成"""
+    process = Mock()
+    process.returncode = returncode
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    process.wait = AsyncMock(return_value=returncode)
+    return process
+
+
+async def _hang():
+    """タイムアウトを発生させるため応答しないcommunicate"""
+    await asyncio.sleep(60)
+
+
+class TestCapturePane:
+    """WorkerCommunicator.capture_paneのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_capture_pane_returns_decoded_output(self):
+        """正常終了時にペイン内容を返すテスト"""
+        communicator = WorkerCommunicator(enable_watch=False)
+        process = _mock_process(stdout="line1\nライン2\n".encode())
+
+        with patch(
+            "scripts.worker_communication.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ) as mock_exec:
+            content = await communicator.capture_pane("cozy-hive:queen", start_line=-5)
+
+        assert content == "line1\nライン2\n"
+        assert mock_exec.call_args.args == (
+            "tmux",
+            "capture-pane",
+            "-t",
+            "cozy-hive:queen",
+            "-p",
+            "-S",
+            "-5",
+        )
+
+    @pytest.mark.asyncio
+    async def test_capture_pane_raises_on_nonzero_exit(self):
+        """tmuxが異常終了した場合にCalledProcessErrorを送出するテスト"""
+        communicator = WorkerCommunicator(enable_watch=False)
+        process = _mock_process(returncode=1, stderr=b"can't find pane")
+
+        with patch(
+            "scripts.worker_communication.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            with pytest.raises(subprocess.CalledProcessError) as exc_info:
+                await communicator.capture_pane("cozy-hive:missing")
+
+        assert exc_info.value.returncode == 1
+        assert exc_info.value.stderr == b"can't find pane"
+
+    @pytest.mark.asyncio
+    async def test_capture_pane_kills_process_on_timeout(self):
+        """タイムアウト時にプロセスを終了しTimeoutExpiredを送出するテスト"""
+        communicator = WorkerCommunicator(enable_watch=False)
+        process = _mock_process()
+        process.communicate = AsyncMock(side_effect=_hang)
+
+        with patch(
+            "scripts.worker_communication.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            with patch("scripts.worker_communication.TMUX_COMMAND_TIMEOUT", 0.01):
+                with pytest.raises(subprocess.TimeoutExpired):
+                    await communicator.capture_pane("cozy-hive:queen")
+
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_capture_pane_timeout_tolerates_exited_process(self):
+        """kill前にプロセスが終了していてもTimeoutExpiredを送出するテスト"""
+        communicator = WorkerCommunicator(enable_watch=False)
+        process = _mock_process()
+        process.communicate = AsyncMock(side_effect=_hang)
+        process.kill.side_effect = ProcessLookupError
+
+        with patch(
+            "scripts.worker_communication.asyncio.create_subprocess_exec",
+            AsyncMock(return_value=process),
+        ):
+            with patch("scripts.worker_communication.TMUX_COMMAND_TIMEOUT", 0.01):
+                with pytest.raises(subprocess.TimeoutExpired):
+                    await communicator.capture_pane("cozy-hive:queen")
+
+        process.wait.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -11,6 +11,7 @@ from unittest.mock import Mock, mock_open, patch
 import pytest
 
 from web.dashboard.api.dashboard_api import (
+    CommunicationMessage,
     DashboardData,
     HiveDashboardCollector,
 )
@@ -53,8 +54,7 @@ class TestHiveDashboardCollector:
                 assert isinstance(result.recent_messages, list)
                 assert isinstance(result.performance_metrics, dict)
 
-    @pytest.mark.asyncio
-    async def test_collect_worker_status_active_session(self):
+    def test_collect_worker_status_active_session(self):
         """アクティブセッションでのWorker状態収集テスト"""
         with patch(
             "web.dashboard.api.dashboard_api.WorkerCommunicator"
@@ -77,7 +77,7 @@ class TestHiveDashboardCollector:
                     },
                 }
 
-                workers = await collector._collect_worker_status()
+                workers = collector._collect_worker_status()
 
                 # 結果確認
                 assert len(workers) == 3
@@ -100,8 +100,7 @@ class TestHiveDashboardCollector:
                 assert tester_worker.emoji == "🧪"
                 assert tester_worker.last_activity is not None
 
-    @pytest.mark.asyncio
-    async def test_collect_worker_status_inactive_session(self):
+    def test_collect_worker_status_inactive_session(self):
         """非アクティブセッションでのWorker状態収集テスト"""
         with patch(
             "web.dashboard.api.dashboard_api.WorkerCommunicator"
@@ -120,7 +119,7 @@ class TestHiveDashboardCollector:
                     "workers": {},
                 }
 
-                workers = await collector._collect_worker_status()
+                workers = collector._collect_worker_status()
 
                 # 結果確認
                 assert len(workers) == 7  # デフォルトWorkerの数
@@ -215,6 +214,71 @@ invalid json line
                 assert messages[0].message == "Valid message 1"
                 assert messages[1].message == "Valid message 2"
 
+    def test_collect_recent_messages_reuses_unchanged_log(self, tmp_path):
+        """ログファイル未変更時に解析結果を再利用するテスト"""
+        with patch(
+            "web.dashboard.api.dashboard_api.WorkerCommunicator"
+        ) as mock_comm_class:
+            with patch("web.dashboard.api.dashboard_api.HiveWatch") as mock_watch_class:
+                mock_comm_class.return_value = Mock()
+                mock_watch_class.return_value = Mock()
+
+                collector = HiveDashboardCollector()
+                collector.log_file = tmp_path / "hive_communications.log"
+                collector.log_file.write_text(
+                    '{"timestamp": "2024-01-01T12:00:00", "source": "queen", '
+                    '"target": "developer", "message": "First"}\n',
+                    encoding="utf-8",
+                )
+
+                with patch("builtins.open", wraps=open) as mock_file:
+                    first = collector._collect_recent_messages()
+                    second = collector._collect_recent_messages()
+
+                assert mock_file.call_count == 1
+                assert [m.message for m in second] == [m.message for m in first]
+
+                # 追記されたら再読み込みする
+                with open(collector.log_file, "a", encoding="utf-8") as f:
+                    f.write(
+                        '{"timestamp": "2024-01-01T12:01:00", "source": "developer", '
+                        '"target": "queen", "message": "Second"}\n'
+                    )
+
+                messages = collector._collect_recent_messages()
+                assert [m.message for m in messages] == ["First", "Second"]
+
+    def test_collect_recent_messages_shares_cache_across_limits(self, tmp_path):
+        """異なるlimitの呼び出しが同じ解析結果を共有するテスト"""
+        with patch(
+            "web.dashboard.api.dashboard_api.WorkerCommunicator"
+        ) as mock_comm_class:
+            with patch("web.dashboard.api.dashboard_api.HiveWatch") as mock_watch_class:
+                mock_comm_class.return_value = Mock()
+                mock_watch_class.return_value = Mock()
+
+                collector = HiveDashboardCollector()
+                collector.log_file = tmp_path / "hive_communications.log"
+                collector.log_file.write_text(
+                    "".join(
+                        f'{{"timestamp": "2024-01-01T12:00:00", "source": "queen", '
+                        f'"target": "developer", "message": "Message {i}"}}\n'
+                        for i in range(30)
+                    ),
+                    encoding="utf-8",
+                )
+
+                with patch("builtins.open", wraps=open) as mock_file:
+                    full = collector._collect_recent_messages(100)
+                    tail = collector._collect_recent_messages(20)
+                    again = collector._collect_recent_messages(100)
+
+                # ファイルの読み込みは1回のみで、limitごとに末尾を切り出す
+                assert mock_file.call_count == 1
+                assert len(full) == 30
+                assert [m.message for m in tail] == [m.message for m in full[-20:]]
+                assert [m.message for m in again] == [m.message for m in full]
+
     def test_get_current_session_info_inactive(self):
         """非アクティブセッションの情報取得テスト"""
         with patch(
@@ -411,6 +475,52 @@ invalid json line
                 assert result.current_session.status == "active"
                 assert result.performance_metrics["efficiency"] == 0  # ファイルなし
 
+                # tmuxへの状態問い合わせは収集1回につき1度だけ
+                mock_communicator.monitor_worker_status.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_collect_dashboard_data_reads_log_once(self):
+        """ダッシュボードデータ収集時に通信ログを一度だけ読み込むテスト"""
+        with patch(
+            "web.dashboard.api.dashboard_api.WorkerCommunicator"
+        ) as mock_comm_class:
+            with patch("web.dashboard.api.dashboard_api.HiveWatch") as mock_watch_class:
+                mock_communicator = Mock()
+                mock_hive_watch = Mock()
+                mock_comm_class.return_value = mock_communicator
+                mock_watch_class.return_value = mock_hive_watch
+
+                collector = HiveDashboardCollector()
+
+                mock_communicator.monitor_worker_status.return_value = {
+                    "session_active": True,
+                    "workers": {"queen": {"pane_active": True}},
+                }
+
+                from datetime import datetime
+
+                test_messages = [
+                    CommunicationMessage(
+                        timestamp=datetime.now().isoformat(),
+                        source="queen",
+                        target="developer",
+                        message_type="task",
+                        message=f"Message {i}",
+                    )
+                    for i in range(20)
+                ]
+
+                with patch.object(
+                    collector, "_collect_recent_messages", return_value=test_messages
+                ) as mock_collect:
+                    result = await collector.collect_dashboard_data()
+
+                mock_collect.assert_called_once_with(100)
+                assert len(result.recent_messages) == 10
+                assert result.recent_messages[-1].message == "Message 19"
+                assert result.current_session is not None
+                assert result.current_session.message_count == 20
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -10,6 +10,7 @@ import asyncio
 import json
 import sys
 import time
+from collections import deque
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +30,9 @@ from scripts.hive_cli import HiveCLI
 from scripts.hive_watch import HiveWatch
 from scripts.worker_communication import WorkerCommunicator
 
+# 通信ログ解析結果のキャッシュに保持する末尾行数（ダッシュボード収集の最大件数）
+LOG_CACHE_LINES = 100
+
 
 class WorkerStatus(BaseModel):
     """Worker状態モデル"""
@@ -133,6 +137,13 @@ class HiveDashboardCollector:
     def __init__(self) -> None:
         self.communicator = WorkerCommunicator()
         self.hive_watch = HiveWatch()
+        project_root = Path(__file__).parent.parent.parent.parent
+        self.log_file = project_root / "logs" / "hive_communications.log"
+        # (mtime_ns, size) をキーにした通信ログ解析結果のキャッシュ
+        # （キー, 読み込んだ末尾行数, 解析済みメッセージ）
+        self._log_cache: (
+            tuple[tuple[int, int], int, list[CommunicationMessage]] | None
+        ) = None
         self.worker_emojis = {
             "queen": "👑",
             "developer": "👨‍💻",
@@ -147,17 +158,24 @@ class HiveDashboardCollector:
         """ダッシュボード用データを収集"""
         timestamp = datetime.now().isoformat()
 
+        # Worker状態（tmuxへの問い合わせ）と通信ログは一度だけ取得して各集計で共有
+        # （互いに独立したブロッキングI/Oのため、スレッドで並行実行）
+        status_data, log_messages = await asyncio.gather(
+            asyncio.to_thread(self.communicator.monitor_worker_status),
+            asyncio.to_thread(self._collect_recent_messages, 100),
+        )
+
         # Worker状態収集
-        workers = await self._collect_worker_status()
+        workers = self._collect_worker_status(status_data)
 
         # 最近の通信メッセージ収集
-        recent_messages = self._collect_recent_messages()
+        recent_messages = log_messages[-10:]
 
         # 現在セッション情報
-        current_session = self._get_current_session_info()
+        current_session = self._get_current_session_info(log_messages, status_data)
 
         # パフォーマンス指標
-        performance_metrics = self._calculate_performance_metrics()
+        performance_metrics = self._calculate_performance_metrics(log_messages[-50:])
 
         return DashboardData(
             timestamp=timestamp,
@@ -167,9 +185,12 @@ class HiveDashboardCollector:
             performance_metrics=performance_metrics,
         )
 
-    async def _collect_worker_status(self) -> list[WorkerStatus]:
+    def _collect_worker_status(
+        self, status_data: dict[str, Any] | None = None
+    ) -> list[WorkerStatus]:
         """Worker状態を収集"""
-        status_data = self.communicator.monitor_worker_status()
+        if status_data is None:
+            status_data = self.communicator.monitor_worker_status()
         workers = []
 
         if status_data.get("session_active", False):
@@ -198,17 +219,36 @@ class HiveDashboardCollector:
 
     def _collect_recent_messages(self, limit: int = 10) -> list[CommunicationMessage]:
         """最近の通信メッセージを収集"""
-        project_root = Path(__file__).parent.parent.parent.parent
-        log_file = project_root / "logs" / "hive_communications.log"
         messages: list[CommunicationMessage] = []
 
-        if not log_file.exists():
+        if not self.log_file.exists():
             return messages
 
+        # ファイルが変更されていなければ前回の解析結果を再利用
+        # （別スレッドからの更新に備え、キャッシュは一度だけ参照する）
+        cache_key: tuple[int, int] | None
+        try:
+            stat = self.log_file.stat()
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            cache_key = None
+
+        cached = self._log_cache
+        if (
+            cache_key is not None
+            and cached is not None
+            and cached[0] == cache_key
+            and limit <= cached[1]
+        ):
+            return cached[2][-limit:] if limit > 0 else []
+
+        # 呼び出し元ごとにlimitが異なっても共有できるよう、最低LOG_CACHE_LINES行読む
+        read_lines = max(limit, LOG_CACHE_LINES)
+
         try:
-            with open(log_file, encoding="utf-8") as f:
-                lines = f.readlines()
-                recent_lines = lines[-limit:] if len(lines) > limit else lines
+            with open(self.log_file, encoding="utf-8") as f:
+                # 全行をリスト化せず、末尾の行だけを保持しながら読み進める
+                recent_lines = deque(f, maxlen=read_lines)
 
                 for line in recent_lines:
                     try:
@@ -233,12 +273,21 @@ class HiveDashboardCollector:
                         continue
         except Exception as e:
             print(f"Error reading communication logs: {e}")
+            return messages[-limit:] if limit > 0 else []
+
+        if cache_key is not None:
+            self._log_cache = (cache_key, read_lines, messages)
 
-        return messages
+        return messages[-limit:] if limit > 0 else []
 
-    def _get_current_session_info(self) -> SessionInfo | None:
+    def _get_current_session_info(
+        self,
+        messages: list[CommunicationMessage] | None = None,
+        status_data: dict[str, Any] | None = None,
+    ) -> SessionInfo | None:
         """現在のセッション情報を取得"""
-        status_data = self.communicator.monitor_worker_status()
+        if status_data is None:
+            status_data = self.communicator.monitor_worker_status()
 
         if not status_data.get("session_active", False):
             return None
@@ -254,15 +303,20 @@ class HiveDashboardCollector:
             session_id=f"session_{int(time.time())}",
             start_time=datetime.now().strftime("%H:%M:%S"),
             active_workers=active_workers,
-            message_count=len(self._collect_recent_messages(100)),
+            message_count=len(
+                messages if messages is not None else self._collect_recent_messages(100)
+            ),
             status="active",
         )
 
         return session_info
 
-    def _calculate_performance_metrics(self) -> dict[str, Any]:
+    def _calculate_performance_metrics(
+        self, messages: list[CommunicationMessage] | None = None
+    ) -> dict[str, Any]:
         """パフォーマンス指標を計算"""
-        messages = self._collect_recent_messages(50)
+        if messages is None:
+            messages = self._collect_recent_messages(50)
 
         if not messages:
             return {
@@ -272,13 +326,12 @@ class HiveDashboardCollector:
                 "active_workers": 0,
             }
 
-        # 簡易パフォーマンス計算
-        recent_count = len(
-            [
-                m
-                for m in messages
-                if (datetime.now() - datetime.fromisoformat(m.timestamp)).seconds < 300
-            ]
+        # 簡易パフォーマンス計算（基準時刻はメッセージ毎ではなく一度だけ取得）
+        now = datetime.now()
+        recent_count = sum(
+            1
+            for m in messages
+            if (now - datetime.fromisoformat(m.timestamp)).seconds < 300
         )
 
         return {
@@ -388,7 +441,7 @@ async def get_system_status() -> dict[str, Any]:
         "status": "active" if data.current_session else "inactive",
         "timestamp": data.timestamp,
         "worker_count": len(data.workers),
-        "active_workers": len([w for w in data.workers if w.status == "active"]),
+        "active_workers": sum(1 for w in data.workers if w.status == "active"),
         "message_count": len(data.recent_messages),
     }
 
@@ -403,7 +456,8 @@ async def get_workers() -> dict[str, Any]:
 @app.get("/api/messages")
 async def get_recent_messages(limit: int = 20) -> dict[str, Any]:
     """最近のメッセージAPI"""
-    messages = collector._collect_recent_messages(limit)
+    # ログ読み込みでイベントループを止めないようスレッドで実行
+    messages = await asyncio.to_thread(collector._collect_recent_messages, limit)
     return {"messages": [m.model_dump() for m in messages]}
 
 